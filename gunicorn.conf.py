@@ -0,0 +1,16 @@
+# Production server settings: gunicorn -c gunicorn.conf.py server:app
+# (`python server.py` is for local development only)
+import multiprocessing
+
+bind = "0.0.0.0:8000"
+workers = 2 * multiprocessing.cpu_count() + 1
+worker_class = "uvicorn_worker.UvicornWorker"   # pip install uvicorn-worker
+
+# import server.py once in the master and fork it into the workers; the
+# SQLite pool opens its connections per worker on startup, never in the master
+preload_app = True
+
+# uploads are capped at 6 MB, so a slow client shouldn't hold a worker forever
+timeout = 60
+graceful_timeout = 30
+keepalive = 5
@@ -1,7 +1,16 @@
-from flask import Flask, request, jsonify, send_from_directory, send_file
-from flask_cors import CORS
-import sqlite3, os, pathlib, time
-from werkzeug.utils import secure_filename
+from quart import Quart, Response, g, request, send_from_directory, send_file
+from quart_cors import route_cors
+from cachetools import TTLCache
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from streaming_form_data import StreamingFormDataParser
+from streaming_form_data.parser import ParseFailedException
+from streaming_form_data.targets import BaseTarget, ValueTarget
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+import aiosqlite, orjson, uvicorn
+import asyncio, hashlib, secrets, sqlite3, os, pathlib, sys, tempfile
+from typing import Final
 
 # ------------------ Config ------------------
 APP_DIR = pathlib.Path(__file__).parent.resolve()
@@ -11,234 +20,521 @@ UPLOAD_DIR.mkdir(exist_ok=True)
 
 ALLOWED_EXTENSIONS = {"png", "jpg", "jpeg", "webp", "gif"}
 MAX_CONTENT_LENGTH = 6 * 1024 * 1024        # 6 MB per file
+UPLOAD_PREFIX = "/uploads/"                 # URL prefix for stored photo names
+# Extra origins allowed to call /api/* cross-origin (the pages themselves use
+# relative URLs, so this only matters for a frontend hosted elsewhere);
+# comma-separated in SEENI_CORS_ORIGINS
+CORS_ORIGINS = [o.strip() for o in os.environ.get(
+    "SEENI_CORS_ORIGINS", "http://127.0.0.1:5500,http://localhost:5500"
+).split(",") if o.strip()]
+CORS_MAX_AGE = 86400                        # browsers cache preflights for a day
+UPLOAD_CHUNK_SIZE = 1024 * 1024             # feed the form parser 1 MB at a time
+DB_POOL_SIZE = 8                            # warm SQLite connections per worker
+PAGE_SIZE = 50                              # default /api/employees page
+MAX_PAGE_SIZE = 200                         # upper bound for ?limit=
+AUTH_CACHE_TTL = 300                        # seconds an admin key lookup is reused
+LOGIN_CACHE_TTL = 60                        # seconds a verified password is reused
 
-app = Flask(__name__, static_folder=None)   # serve files manually below
+app = Quart(__name__, static_folder=None)   # serve files manually below
 app.config["MAX_CONTENT_LENGTH"] = MAX_CONTENT_LENGTH
-CORS(app)  # allow your frontend (fetch to 127.0.0.1:8000)
+
+# CORS only on /api/*: the frontend fetches these cross-origin, everything else
+# is same-origin and skips the header work
+api_cors = route_cors(
+    allow_origin=CORS_ORIGINS,
+    allow_methods=["GET", "POST", "DELETE"],
+    allow_headers=["Content-Type"],
+    max_age=CORS_MAX_AGE,
+)
 
 # ------------------ DB helpers ------------------
-def get_db():
-    return sqlite3.connect(DB_FILE)
-
-def init_db():
-    with get_db() as conn:
-        c = conn.cursor()
-
-        # Users table (for /login)
-        c.execute("""
-            CREATE TABLE IF NOT EXISTS users(
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                username TEXT UNIQUE NOT NULL,
-                password TEXT NOT NULL
-            )
-        """)
+class ConnectionPool:
+    """Bounded LIFO stack of warm aiosqlite connections.
 
-        # Admin table (for /api/check-key)
-        c.execute("""
-            CREATE TABLE IF NOT EXISTS admin(
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                adminpass TEXT NOT NULL
-            )
-        """)
-
-        # Employees table (for your register page)
-        c.execute("""
-            CREATE TABLE IF NOT EXISTS employees(
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                email TEXT NOT NULL,
-                department TEXT NOT NULL,
-                role TEXT NOT NULL,
-                roll_number TEXT NOT NULL UNIQUE,
-                photo_path TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    Reusing connections skips the open of the .db/-wal/-shm files and keeps
+    SQLite's page cache hot between requests.
+    """
+
+    # per-connection settings; journal_mode=WAL is persistent and set in init_db
+    PRAGMAS = """
+        PRAGMA synchronous=NORMAL;
+        PRAGMA busy_timeout=5000;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA mmap_size=268435456;
+        PRAGMA cache_size=-40000;
+    """
+
+    def __init__(self, db_file, size: int):
+        self.db_file = db_file
+        self.size = size
+        self._idle = asyncio.LifoQueue()
+        self._conns = []
+        self._opened = 0    # connections open or being opened
+
+    async def get(self):
+        if self._idle.empty() and self._opened < self.size:
+            # reserve the slot before connect() yields, or concurrent callers
+            # would all pass the size check
+            self._opened += 1
+            try:
+                conn = await self._connect()
+            except BaseException:
+                self._opened -= 1
+                raise
+            self._conns.append(conn)
+            return conn
+        return await self._idle.get()
+
+    async def _connect(self):
+        conn = await aiosqlite.connect(self.db_file)
+        try:
+            conn.row_factory = sqlite3.Row
+            await conn.executescript(self.PRAGMAS)
+        except BaseException:
+            await conn.close()
+            raise
+        return conn
+
+    async def put(self, conn):
+        if conn.in_transaction:
+            await conn.rollback()   # never hand out a half-finished transaction
+        self._idle.put_nowait(conn)
+
+    @asynccontextmanager
+    async def connection(self):
+        conn = await self.get()
+        try:
+            yield conn
+        finally:
+            await self.put(conn)
+
+    async def close(self):
+        while self._conns:
+            await self._conns.pop().close()
+        self._opened = 0
+        self._idle = asyncio.LifoQueue()
+
+pool = ConnectionPool(DB_FILE, DB_POOL_SIZE)
+password_hasher = PasswordHasher()
+
+async def get_db():
+    """Connection for the current request: borrowed from the pool on first
+    use and handed back by close_db when the app context is torn down."""
+    conn = g.get("_db")
+    if conn is None:
+        conn = g._db = await pool.get()
+    return conn
+
+@app.teardown_appcontext
+async def close_db(_exc):
+    conn = g.pop("_db", None)
+    if conn is not None:
+        await pool.put(conn)
+
+# Bump when SCHEMA or the data fix-ups in init_db change; stored in the
+# database's PRAGMA user_version so later startups skip all of it
+SCHEMA_VERSION = 1
+
+# Whole schema + demo seeds, applied in one transaction by init_db
+SCHEMA = """
+-- WAL: readers don't block on writers, one fsync per commit (persistent)
+PRAGMA journal_mode=WAL;
+
+BEGIN;
+
+-- Users table (for /login); password holds an argon2 hash
+CREATE TABLE IF NOT EXISTS users(
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    username TEXT UNIQUE NOT NULL,
+    password TEXT NOT NULL
+);
+
+-- Admin table (for /api/check-key)
+CREATE TABLE IF NOT EXISTS admin(
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    adminpass TEXT NOT NULL
+);
+
+-- Employees table (for your register page)
+CREATE TABLE IF NOT EXISTS employees(
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    department TEXT NOT NULL,
+    role TEXT NOT NULL,
+    roll_number TEXT NOT NULL UNIQUE,
+    photo_path TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- /login looks users up by username only (covered by its UNIQUE constraint).
+-- The unique index on adminpass serves /api/check-key and lets the seed
+-- below use INSERT OR IGNORE
+CREATE UNIQUE INDEX IF NOT EXISTS idx_admin_pass_unique ON admin(adminpass);
+
+-- Demo data
+INSERT OR IGNORE INTO users (username, password)
+    VALUES ('hidan', '$argon2id$v=19$m=65536,t=3,p=4$pCx3cWAKsAJw3Z/ztUYisQ$5WZwlr1lZBuxS+SJQ7iYZmEm6UYRTRmrXcYOiuGnj3U');  -- killer
+INSERT OR IGNORE INTO admin (adminpass) VALUES ('ceo@2025');
+
+COMMIT;
+"""
+
+# Hot-path statements, kept as constants so every call hits the same
+# statement-cache entry
+EMPLOYEE_COLUMNS: Final[str] = "id, name, email, department, role, roll_number, photo_path, created_at"
+_SQL_USER_HASH: Final[str] = "SELECT password FROM users WHERE username=?"
+_SQL_ADMIN_KEY: Final[str] = "SELECT 1 FROM admin WHERE adminpass=? LIMIT 1"
+_SQL_INSERT: Final[str] = (
+    "INSERT INTO employees (name, email, department, role, roll_number, photo_path) "
+    "VALUES (?,?,?,?,?,?)"
+)
+_SQL_LIST: Final[str] = f"SELECT {EMPLOYEE_COLUMNS} FROM employees WHERE id < ? ORDER BY id DESC LIMIT ?"
+_SQL_GET: Final[str] = f"SELECT {EMPLOYEE_COLUMNS} FROM employees WHERE id=?"
+_SQL_PHOTO: Final[str] = "SELECT photo_path FROM employees WHERE id=?"
+_SQL_DELETE: Final[str] = "DELETE FROM employees WHERE id=?"
+_SQL_DELETE_RETURNING: Final[str] = "DELETE FROM employees WHERE id=? RETURNING photo_path"
+HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+async def init_db():
+    async with pool.connection() as conn:
+        async with conn.execute("PRAGMA user_version") as cur:
+            (version,) = await cur.fetchone()
+        if version >= SCHEMA_VERSION:
+            return
+
+        await conn.executescript(SCHEMA)
+
+        # photo_path used to hold the full save path; keep just the file name
+        cur = await conn.execute(
+            "SELECT id, photo_path FROM employees "
+            "WHERE instr(photo_path, '/') OR instr(photo_path, char(92))"
+        )
+        legacy = await cur.fetchall()
+        if legacy:
+            await conn.executemany(
+                "UPDATE employees SET photo_path=? WHERE id=?",
+                [(pathlib.PureWindowsPath(r["photo_path"]).name, r["id"]) for r in legacy]
             )
-        """)
+            await conn.commit()
+
+        # users.password used to be plaintext; hash whatever is left over
+        cur = await conn.execute("SELECT id, password FROM users WHERE password NOT LIKE '$argon2%'")
+        plain = await cur.fetchall()
+        if plain:
+            hashed = [(await asyncio.to_thread(password_hasher.hash, r["password"]), r["id"]) for r in plain]
+            await conn.executemany("UPDATE users SET password=? WHERE id=?", hashed)
+            await conn.commit()
 
-        # Seed demo data if empty
-        user_count = c.execute("SELECT COUNT(*) FROM users").fetchone()[0]
-        if user_count == 0:
-            c.execute("INSERT INTO users (username, password) VALUES (?,?)",
-                      ("hidan", "killer"))
+        await conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        await conn.commit()
 
-        admin_count = c.execute("SELECT COUNT(*) FROM admin").fetchone()[0]
-        if admin_count == 0:
-            c.execute("INSERT INTO admin (adminpass) VALUES (?)",
-                      ("ceo@2025",))
+@app.before_serving
+async def startup():
+    await init_db()
 
-        conn.commit()
+@app.after_serving
+async def shutdown():
+    await pool.close()
 
 def row_to_employee_dict(row):
-    # row order must match SELECT columns below
-    (id_, name, email, department, role, roll, photo, created) = row
-    return {
-        "id": id_,
-        "name": name,
-        "email": email,
-        "department": department,
-        "role": role,
-        "roll_number": roll,
-        "photo_url": f"/uploads/{os.path.basename(photo)}" if photo else None,
-        "created_at": created
-    }
+    # row is a sqlite3.Row; photo_path is just the file name inside UPLOAD_DIR
+    emp = dict(row)
+    photo = emp.pop("photo_path")
+    emp["photo_url"] = UPLOAD_PREFIX + photo if photo else None
+    return emp
 
 def allowed_file(filename: str) -> bool:
     return "." in filename and filename.rsplit(".", 1)[1].lower() in ALLOWED_EXTENSIONS
 
+# photo deletions run here so the DELETE response doesn't wait on the filesystem
+fs_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="upload-rm")
+
+def remove_upload(path):
+    try:
+        os.unlink(path)
+    except OSError:
+        pass  # already gone, or other filesystem errors we can't act on
+
+def ojson(**payload):
+    """jsonify() replacement backed by orjson (C encoder, native datetimes)."""
+    return Response(orjson.dumps(payload, option=orjson.OPT_NAIVE_UTC), mimetype="application/json")
+
+EMPLOYEE_FIELDS = ("name", "email", "department", "role", "roll_number")
+
+# Leading bytes of the accepted image formats (WEBP is RIFF....WEBP, see is_image)
+IMAGE_MAGIC = (b"\x89PNG\r\n\x1a\n", b"\xff\xd8\xff", b"GIF87a", b"GIF89a")
+MAGIC_HEAD_SIZE = 32
+
+def is_image(head: bytes) -> bool:
+    return head.startswith(IMAGE_MAGIC) or (head[:4] == b"RIFF" and head[8:12] == b"WEBP")
+
+class PhotoTarget(BaseTarget):
+    """
+    Like FileTarget, but holds back the first MAGIC_HEAD_SIZE bytes and only
+    opens the file once they look like a supported image. Anything else is
+    dropped without touching the disk and flagged as rejected.
+    """
+
+    def __init__(self, filename):
+        super().__init__()
+        self.filename = filename
+        self.rejected = False
+        self._head = bytearray()
+        self._fd = None
+
+    def _check_head(self):
+        if is_image(self._head):
+            self._fd = open(self.filename, "wb")
+            self._fd.write(self._head)
+        else:
+            self.rejected = True
+        self._head.clear()
+
+    def on_data_received(self, chunk: bytes):
+        if self._fd is not None:
+            self._fd.write(chunk)
+        elif not self.rejected:
+            self._head += chunk
+            if len(self._head) >= MAGIC_HEAD_SIZE:
+                self._check_head()
+
+    def on_finish(self):
+        if self._fd is None and not self.rejected:
+            self._check_head()      # part shorter than MAGIC_HEAD_SIZE
+        if self._fd is not None:
+            self._fd.close()
+
+async def parse_employee_form(photo_path):
+    """
+    Stream the multipart body through streaming-form-data: text fields are
+    collected in memory, the photo part is written straight to photo_path
+    (if its magic bytes check out, see PhotoTarget).
+    Returns (fields, photo_target).
+    """
+    parser = StreamingFormDataParser(headers=request.headers)
+    values = {k: ValueTarget() for k in EMPLOYEE_FIELDS}
+    for k, target in values.items():
+        parser.register(k, target)
+    photo = PhotoTarget(str(photo_path))
+    parser.register("photo", photo)
+
+    # the server hands us small chunks; batch them so the photo is written in
+    # UPLOAD_CHUNK_SIZE blocks instead of one write() per network read
+    buf = bytearray()
+    async for chunk in request.body:
+        buf += chunk
+        if len(buf) >= UPLOAD_CHUNK_SIZE:
+            parser.data_received(bytes(buf))
+            buf.clear()
+    if buf:
+        parser.data_received(bytes(buf))
+
+    fields = {k: target.value.decode("utf-8", "replace").strip() for k, target in values.items()}
+    return fields, photo
+
 # ------------------ Static/Index ------------------
 @app.route("/")
-def index():
+async def index():
     # Keep your main index if you have one; otherwise open employee-delete.html in browser directly
     index_path = APP_DIR / "index.html"
     if index_path.exists():
-        return send_file(index_path)
+        return await send_file(index_path, conditional=True)
     return "<h3>Backend is running. Open /employee-delete.html to manage employees.</h3>"
 
 @app.route("/<path:path>")
-def static_files(path):
+async def static_files(path):
     # Serve any local file next to server.py (HTML/CSS/JS)
     target = APP_DIR / path
     if target.exists():
-        return send_file(target)
+        return await send_file(target, conditional=True)
     return "Not Found", 404
 
 @app.route("/uploads/<path:filename>")
-def get_upload(filename):
-    return send_from_directory(UPLOAD_DIR, filename, as_attachment=False)
+async def get_upload(filename):
+    # upload names are unique random tokens and never rewritten, so browsers
+    # can keep them for a year (Cache-Control max-age and Expires agree)
+    resp = await send_from_directory(UPLOAD_DIR, filename, as_attachment=False,
+                                     conditional=True, cache_timeout=31536000)
+    resp.cache_control.immutable = True
+    return resp
 
 # ------------------ Auth / Admin ------------------
+# users/admin are seeded once and never edited through the API, so lookups are
+# cached in-process; call .clear() on these if an endpoint ever mutates them.
+# Login results are keyed on a SHA-256 of the password so plaintext never sits
+# in memory, and repeat logins skip the (deliberately slow) argon2 verify.
+_user_cache = TTLCache(maxsize=10_000, ttl=LOGIN_CACHE_TTL)
+_admin_cache = TTLCache(maxsize=1024, ttl=AUTH_CACHE_TTL)
+
+async def _check_user(username: str, password: str) -> bool:
+    cache_key = (username, hashlib.sha256(password.encode()).digest())
+    hit = _user_cache.get(cache_key)
+    if hit is None:
+        conn = await get_db()
+        cur = await conn.execute(_SQL_USER_HASH, (username,))
+        row = await cur.fetchone()
+        hit = False
+        if row:
+            try:
+                # argon2 is CPU-heavy; keep it off the event loop
+                hit = await asyncio.to_thread(password_hasher.verify, row["password"], password)
+            except (VerificationError, InvalidHashError):
+                hit = False
+        _user_cache[cache_key] = hit
+    return hit
+
+async def _check_admin(key: str) -> bool:
+    hit = _admin_cache.get(key)
+    if hit is None:
+        conn = await get_db()
+        cur = await conn.execute(_SQL_ADMIN_KEY, (key,))
+        hit = _admin_cache[key] = await cur.fetchone() is not None
+    return hit
+
 @app.route("/login", methods=["POST"])
-def login():
-    username = request.form.get("username") or ""
-    password = request.form.get("password") or ""
+async def login():
+    form = await request.form
+    username = form.get("username") or ""
+    password = form.get("password") or ""
     try: 
-        with get_db() as conn:
-            cur = conn.execute(
-                "SELECT id FROM users WHERE username=? AND password=?",
-                (username, password)
-            )
-            row = cur.fetchone()
-        return jsonify({"status": "success" if row else "fail"})
+        ok = await _check_user(username, password)
+        return ojson(status="success" if ok else "fail")
     except Exception as e:
-        return jsonify({"status": "error", "message": str(e)}), 500
+        return ojson(status="error", message=str(e)), 500
 
 @app.post("/api/check-key")
-def check_key():
-    data = request.get_json(silent=True) or {}
+@api_cors
+async def check_key():
+    data = await request.get_json(silent=True) or {}
     key = data.get("key", "")
-    with get_db() as conn:
-        cur = conn.execute("SELECT 1 FROM admin WHERE adminpass=? LIMIT 1", (key,))
-        row = cur.fetchone()
-    return jsonify(ok=bool(row))
+    return ojson(ok=await _check_admin(key))
 
 # ------------------ Employees API ------------------
 @app.post("/api/employees")
-def create_employee():
+@api_cors
+async def create_employee():
     """
     Accepts multipart/form-data with fields:
       name, email, department, role, roll_number, photo (file, optional)
     Returns: { ok: true, employee_id, photo_url? } or error.
     """
+    # photo bytes land here while the body is parsed; renamed once validated
+    fd, tmp_name = tempfile.mkstemp(dir=UPLOAD_DIR, suffix=".part")
+    os.close(fd)
+    tmp_path = pathlib.Path(tmp_name)
     try:
-        name = (request.form.get("name") or "").strip()
-        email = (request.form.get("email") or "").strip()
-        department = (request.form.get("department") or "").strip()
-        role = (request.form.get("role") or "").strip()
-        roll_number = (request.form.get("roll_number") or "").strip()
+        try:
+            fields, photo = await parse_employee_form(tmp_path)
+        except ParseFailedException:
+            return ojson(ok=False, message="Expected multipart/form-data"), 400
+        name = fields["name"]
+        email = fields["email"]
+        department = fields["department"]
+        role = fields["role"]
+        roll_number = fields["roll_number"]
 
         # Validate
-        missing = [k for k, v in {
-            "name": name, "email": email, "department": department,
-            "role": role, "roll_number": roll_number
-        }.items() if not v]
+        missing = [k for k, v in fields.items() if not v]
         if missing:
-            return jsonify(ok=False, message=f"Missing fields: {', '.join(missing)}"), 400
+            return ojson(ok=False, message=f"Missing fields: {', '.join(missing)}"), 400
 
         # Handle optional photo
-        photo = request.files.get("photo")
-        photo_path = None
-        if photo and photo.filename:
-            if not allowed_file(photo.filename):
-                return jsonify(ok=False, message="Unsupported image type"), 415
-            # unique filename: roll + timestamp + ext
-            ext = photo.filename.rsplit(".", 1)[1].lower()
-            fname = secure_filename(f"{roll_number}_{int(time.time())}.{ext}")
-            save_path = UPLOAD_DIR / fname
-            photo.save(save_path)
-            photo_path = str(save_path)
+        fname = None
+        if photo.multipart_filename:
+            if not allowed_file(photo.multipart_filename):
+                return ojson(ok=False, message="Unsupported image type"), 415
+            if photo.rejected:
+                return ojson(ok=False, message="File is not a supported image"), 415
+            # unique filename: random URL-safe token + ext (no sanitising needed;
+            # ext is one of ALLOWED_EXTENSIONS)
+            ext = photo.multipart_filename.rsplit(".", 1)[1].lower()
+            fname = f"{secrets.token_urlsafe(12)}.{ext}"
 
         # Insert into DB
-        with get_db() as conn:
-            cur = conn.cursor()
-            cur.execute("""
-                INSERT INTO employees (name, email, department, role, roll_number, photo_path)
-                VALUES (?,?,?,?,?,?)
-            """, (name, email, department, role, roll_number, photo_path))
-            emp_id = cur.lastrowid
-            conn.commit()
-
-        return jsonify(
+        conn = await get_db()
+        cur = await conn.execute(_SQL_INSERT, (name, email, department, role, roll_number, fname))
+        emp_id = cur.lastrowid
+        await conn.commit()
+
+        # only move the photo into place once the row exists; on any earlier
+        # failure the finally below removes the temp file instead
+        if fname:
+            os.replace(tmp_path, UPLOAD_DIR / fname)
+
+        return ojson(
             ok=True,
             employee_id=emp_id,
-            photo_url=(f"/uploads/{os.path.basename(photo_path)}" if photo_path else None)
+            photo_url=(UPLOAD_PREFIX + fname if fname else None)
         ), 201
 
     except sqlite3.IntegrityError as ie:
         # likely duplicate roll_number
         msg = "Roll number already exists." if "UNIQUE" in str(ie).upper() else str(ie)
-        return jsonify(ok=False, message=msg), 409
+        return ojson(ok=False, message=msg), 409
     except Exception as e:
-        return jsonify(ok=False, message=str(e)), 500
+        return ojson(ok=False, message=str(e)), 500
+    finally:
+        tmp_path.unlink(missing_ok=True)
 
 @app.get("/api/employees")
-def list_employees():
-    """List all employees."""
-    with get_db() as conn:
-        cur = conn.execute("""
-            SELECT id, name, email, department, role, roll_number, photo_path, created_at
-            FROM employees
-            ORDER BY id DESC
-        """)
-        rows = cur.fetchall()
-    return jsonify(ok=True, employees=[row_to_employee_dict(r) for r in rows])
+@api_cors
+async def list_employees():
+    """
+    List employees newest first, one page at a time.
+    Query: limit (default PAGE_SIZE, max MAX_PAGE_SIZE), after_id (keyset cursor).
+    Returns: { ok, employees, next_after_id } - next_after_id is null on the last page.
+    """
+    limit = min(max(request.args.get("limit", PAGE_SIZE, type=int), 1), MAX_PAGE_SIZE)
+    after_id = request.args.get("after_id", type=int)
+
+    # keyset pagination: a range seek on the rowid, no OFFSET scan
+    conn = await get_db()
+    cur = await conn.execute(_SQL_LIST, (after_id if after_id is not None else sys.maxsize, limit))
+    employees = [row_to_employee_dict(r) for r in await cur.fetchall()]
+    next_after_id = employees[-1]["id"] if len(employees) == limit else None
+    return ojson(ok=True, employees=employees, next_after_id=next_after_id)
 
 @app.get("/api/employees/<int:emp_id>")
-def get_employee(emp_id: int):
+@api_cors
+async def get_employee(emp_id: int):
     """Fetch single employee by id."""
-    with get_db() as conn:
-        cur = conn.execute("""
-            SELECT id, name, email, department, role, roll_number, photo_path, created_at
-            FROM employees WHERE id=?
-        """, (emp_id,))
-        row = cur.fetchone()
+    conn = await get_db()
+    cur = await conn.execute(_SQL_GET, (emp_id,))
+    row = await cur.fetchone()
     if not row:
-        return jsonify(ok=False, message="Not found"), 404
-    return jsonify(ok=True, employee=row_to_employee_dict(row))
+        return ojson(ok=False, message="Not found"), 404
+    return ojson(ok=True, employee=row_to_employee_dict(row))
 
 # ---- NEW: Delete employee ----
 @app.delete("/api/employees/<int:emp_id>")
-def delete_employee(emp_id: int):
-    with get_db() as conn:
-        cur = conn.execute("SELECT photo_path FROM employees WHERE id=?", (emp_id,))
-        row = cur.fetchone()
-        if not row:
-            return jsonify(ok=False, message="Employee not found"), 404
-        photo_path = row[0]
-        conn.execute("DELETE FROM employees WHERE id=?", (emp_id,))
-        conn.commit()
-
-    # Delete photo file if present
-    if photo_path and os.path.exists(photo_path):
-        try:
-            os.remove(photo_path)
-        except Exception:
-            pass  # ignore filesystem errors
+@api_cors
+async def delete_employee(emp_id: int):
+    conn = await get_db()
+    if HAS_RETURNING:
+        # one statement; fetchall() steps the DELETE to completion before commit
+        cur = await conn.execute(_SQL_DELETE_RETURNING, (emp_id,))
+        rows = await cur.fetchall()
+    else:
+        cur = await conn.execute(_SQL_PHOTO, (emp_id,))
+        rows = await cur.fetchall()
+        if rows:
+            await conn.execute(_SQL_DELETE, (emp_id,))
+    await conn.commit()
+    if not rows:
+        return ojson(ok=False, message="Employee not found"), 404
+    photo = rows[0]["photo_path"]
+    photo_path = UPLOAD_DIR / photo if photo else None
+
+    # Delete photo file if present (in the background)
+    if photo_path:
+        fs_executor.submit(remove_upload, photo_path)
 
-    return jsonify(ok=True, message="Employee deleted")
+    return ojson(ok=True, message="Employee deleted")
 
 # ------------------ Main ------------------
+# Local development only; production runs `gunicorn -c gunicorn.conf.py server:app`
 if __name__ == "__main__":
-    init_db()
     print(f"DB: {DB_FILE}")
     print(f"Uploads: {UPLOAD_DIR}")
-    app.run(host="0.0.0.0", port=8000, debug=True)
+    uvicorn.run("server:app", host="0.0.0.0", port=8000, reload=True)